@@ -11,65 +11,432 @@ Usage:
 Author: Inlighn Tech
 """
 
+import io
 import sys
 import os
-import argparse
+import stat
+import contextlib
+import functools
+import queue
+import threading
 from pathlib import Path
+from types import SimpleNamespace
+
+# PdfReader / PdfWriter classes, imported on first use by _load_pdf_lib() so
+# --help, --version and validation errors never pay for importing pypdf.
+_reader_cls = _writer_cls = None
+
+
+def _load_pdf_lib() -> None:
+    """Import pypdf (or PyPDF2 as a fallback) once and remember its classes."""
+    global _reader_cls, _writer_cls
+    if _reader_cls is not None:
+        return
 
-try:
-    from pypdf import PdfReader, PdfWriter
-except ImportError:
     try:
-        from PyPDF2 import PdfReader, PdfWriter
+        from pypdf import PdfReader, PdfWriter
     except ImportError:
-        print("Error: Neither 'pypdf' nor 'PyPDF2' is installed.")
-        print("Install it with: pip install pypdf")
-        sys.exit(1)
+        try:
+            from PyPDF2 import PdfReader, PdfWriter
+        except ImportError:
+            raise ImportError(
+                "Neither 'pypdf' nor 'PyPDF2' is installed. "
+                "Install it with: pip install pypdf"
+            )
 
+    _reader_cls, _writer_cls = PdfReader, PdfWriter
 
-def validate_input_file(file_path: str) -> Path:
-    """Validate that the input file exists and is a PDF."""
-    path = Path(file_path)
 
-    if not path.exists():
-        raise FileNotFoundError(f"Input file not found: '{file_path}'")
+# pypdf emits many small writes (object headers, xref rows); a 1 MiB buffer
+# collapses them into a handful of write() syscalls.
+_WRITE_BUFFER_SIZE = 1 << 20
 
-    if not path.is_file():
-        raise ValueError(f"Path is not a file: '{file_path}'")
+# Inputs up to this size are read into memory in one sequential read so
+# pypdf's many small seeks during xref parsing never touch the filesystem.
+# Larger files are left to stream from disk.
+_IN_MEMORY_READ_LIMIT = 512 << 20
 
-    if path.suffix.lower() != ".pdf":
-        raise ValueError(f"Input file does not have a .pdf extension: '{file_path}'")
+# Only inputs up to this size are kept in the reader cache, so its 16 entries
+# hold at most 256 MiB of file data.
+_READER_CACHE_MAX_FILE_SIZE = 16 << 20
 
-    if path.stat().st_size == 0:
-        raise ValueError(f"Input file is empty: '{file_path}'")
+# Inputs at least this large have their output handed to a background writer
+# thread, so disk writes overlap pypdf's serialization and encryption.
+_PIPELINED_WRITE_THRESHOLD = 8 << 20
 
-    return path
+# The %%EOF marker is first looked for in this many trailing bytes (where
+# well-formed files keep it); only if it is missing there is the rest of the
+# file scanned, in chunks of _EOF_SCAN_CHUNK bytes.
+_MARKER_SCAN_WINDOW = 1024
+_EOF_SCAN_CHUNK = 1 << 20
 
+# Common spellings of the extension, checked before falling back to a
+# case-insensitive comparison.
+_PDF_EXT = (".pdf", ".PDF")
 
-def validate_output_path(file_path: str) -> Path:
-    """Validate that the output path is writable."""
-    path = Path(file_path)
 
-    if path.suffix.lower() != ".pdf":
-        raise ValueError(f"Output file must have a .pdf extension: '{file_path}'")
+def _has_pdf_ext(file_path: str) -> bool:
+    """Return True if file_path ends in .pdf (any case)."""
+    return file_path.endswith(_PDF_EXT) or file_path[-4:].lower() == ".pdf"
+
+
+# The _*_error helpers below return an (unraised) exception describing the
+# first problem found, or None. check_* report it as an (ok, message) tuple;
+# validate_* raise it.
+
+def _input_file_error(file_path: str) -> tuple:
+    """Return ``(error, stat_result)`` for the input file using one stat() call."""
+    # Reject obviously wrong names before touching the filesystem
+    if not _has_pdf_ext(file_path):
+        return ValueError(f"Input file does not have a .pdf extension: '{file_path}'"), None
+
+    try:
+        st = os.stat(file_path)
+    except (FileNotFoundError, NotADirectoryError):
+        return FileNotFoundError(f"Input file not found: '{file_path}'"), None
+    except PermissionError:
+        return PermissionError(f"No permission to access input file: '{file_path}'"), None
+    except (OSError, ValueError) as e:
+        # e.g. ENAMETOOLONG, ELOOP, or an embedded NUL byte
+        return ValueError(f"Cannot access input file '{file_path}': {e}"), None
+
+    if not stat.S_ISREG(st.st_mode):
+        return ValueError(f"Path is not a file: '{file_path}'"), None
+
+    if st.st_size == 0:
+        return ValueError(f"Input file is empty: '{file_path}'"), None
+
+    return _pdf_marker_error(file_path, st.st_size), st
+
+
+def _pdf_marker_error(file_path: str, size: int):
+    """
+    Cheaply reject files pypdf cannot open before it parses them.
+
+    Mirrors the leniency of pypdf's own %%EOF search: it only warns about a
+    missing ``%PDF-`` header, searches the whole file backwards for
+    ``%%EOF``, and accepts a last line cut short to ``%%EO``, ``%%E``, ``%%``
+    or ``%``. A file is rejected only if none of those apply. The common case
+    reads just the last 1 KiB.
+    """
+    try:
+        with open(file_path, "rb") as input_file:
+            found = _has_eof_marker(input_file, size)
+    except PermissionError:
+        return PermissionError(f"No read permission for file: '{file_path}'")
+    except OSError as e:
+        return ValueError(f"Cannot read input file '{file_path}': {e}")
+
+    if not found:
+        return ValueError(
+            f"Input file is not a PDF or is truncated (missing %%EOF marker): '{file_path}'"
+        )
+
+    return None
+
+
+# Truncated forms of %%EOF that pypdf still accepts at the end of the last line
+_TRUNCATED_EOF_MARKERS = (b"%%EO", b"%%E", b"%%", b"%")
+
+
+def _has_eof_marker(input_file, size: int) -> bool:
+    """Search input_file backwards for %%EOF, starting with the last 1 KiB."""
+    marker = b"%%EOF"
+    end = size
+    chunk_size = _MARKER_SCAN_WINDOW
+    while end > 0:
+        start = max(0, end - chunk_size)
+        input_file.seek(start)
+        # Overlap into the previously scanned chunk so a marker split across
+        # the boundary is still found
+        chunk = input_file.read(end - start + len(marker) - 1)
+        if marker in chunk:
+            return True
+        if end == size:
+            lines = chunk.rstrip(b" \t\r\n\f\x00").splitlines()
+            if lines and lines[-1].strip().endswith(_TRUNCATED_EOF_MARKERS):
+                return True
+        end = start
+        chunk_size = _EOF_SCAN_CHUNK
+    return False
+
+
+def _output_path_error(file_path: str):
+    """Return an exception describing why file_path can't be written, or None."""
+    if not _has_pdf_ext(file_path):
+        return ValueError(f"Output file must have a .pdf extension: '{file_path}'")
 
     # Ensure parent directory exists
-    parent = path.parent
-    if not parent.exists():
-        raise FileNotFoundError(f"Output directory does not exist: '{parent}'")
+    parent = os.path.dirname(file_path) or "."
+    if not os.path.exists(parent):
+        return FileNotFoundError(f"Output directory does not exist: '{parent}'")
 
     if not os.access(parent, os.W_OK):
-        raise PermissionError(f"No write permission for directory: '{parent}'")
+        return PermissionError(f"No write permission for directory: '{parent}'")
 
-    return path
+    return None
 
 
-def validate_password(password: str) -> None:
-    """Validate password strength."""
+def _password_error(password: str):
+    """Return an exception describing why password is too weak, or None."""
+    if password is not None and not isinstance(password, str):
+        return TypeError("Password must be a string.")
     if not password:
-        raise ValueError("Password cannot be empty.")
+        return ValueError("Password cannot be empty.")
     if len(password) < 4:
-        raise ValueError("Password must be at least 4 characters long.")
+        return ValueError("Password must be at least 4 characters long.")
+    return None
+
+
+def check_input_file(file_path: str) -> tuple:
+    """Check the input file without raising; return ``(ok, error_message)``."""
+    error, _ = _input_file_error(os.fspath(file_path))
+    return (False, str(error)) if error else (True, None)
+
+
+def check_output_path(file_path: str) -> tuple:
+    """Check the output path without raising; return ``(ok, error_message)``."""
+    error = _output_path_error(os.fspath(file_path))
+    return (False, str(error)) if error else (True, None)
+
+
+def check_password(password: str) -> tuple:
+    """Check the password without raising; return ``(ok, error_message)``."""
+    error = _password_error(password)
+    return (False, str(error)) if error else (True, None)
+
+
+def _stat_input_file(file_path: str) -> os.stat_result:
+    """Validate the input file with a single stat() call and return the result.
+
+    Callers reuse the stat for the file size instead of hitting the
+    filesystem again.
+    """
+    error, st = _input_file_error(file_path)
+    if error:
+        raise error
+    return st
+
+
+def validate_input_file(file_path: str) -> Path:
+    """Validate that the input file exists and is a PDF."""
+    file_path = os.fspath(file_path)
+    _stat_input_file(file_path)
+    return Path(file_path)
+
+
+def validate_output_path(file_path: str) -> Path:
+    """Validate that the output path is writable."""
+    file_path = os.fspath(file_path)
+    error = _output_path_error(file_path)
+    if error:
+        raise error
+    return Path(file_path)
+
+
+def validate_password(password: str) -> None:
+    """Validate password strength."""
+    error = _password_error(password)
+    if error:
+        raise error
+
+
+def _open_reader(path: str, size: int) -> "PdfReader":
+    """Parse a PDF, reading it into memory first unless it is very large."""
+    if size <= _IN_MEMORY_READ_LIMIT:
+        with open(path, "rb", buffering=0) as input_file:
+            return _reader_cls(io.BytesIO(input_file.read()))
+    return _reader_cls(path)
+
+
+@functools.lru_cache(maxsize=16)
+def _get_reader(path: str, mtime_ns: int, size: int) -> tuple:
+    """
+    Parse a PDF, reusing the reader across calls for an unchanged file.
+
+    Returns ``(reader, lock)``. The reader resolves objects through a single
+    stream, so callers must hold the lock while they use it. The cache key
+    includes the modification time and size, so an edited file is parsed
+    again. Call ``clear_reader_cache()`` to release the cached readers.
+    """
+    return _open_reader(path, size), threading.Lock()
+
+
+def _acquire_reader(path: str, st: os.stat_result) -> tuple:
+    """Return ``(reader, lock)``; only files up to the cache size limit are cached."""
+    if st.st_size <= _READER_CACHE_MAX_FILE_SIZE:
+        return _get_reader(path, st.st_mtime_ns, st.st_size)
+    return _open_reader(path, st.st_size), contextlib.nullcontext()
+
+
+def clear_reader_cache() -> None:
+    """Drop every PdfReader cached by ``protect_pdf``."""
+    _get_reader.cache_clear()
+
+
+def _build_writer(reader: "PdfReader") -> "PdfWriter":
+    """Create a writer holding a copy of every page (and metadata) of reader."""
+    # Clone the document root, /Info and /ID in one pass: objects shared
+    # between pages (fonts, images) are copied once and content streams are
+    # carried over as-is instead of being rebuilt page by page.
+    try:
+        return _writer_cls(clone_from=reader)
+    except TypeError:
+        pass
+
+    # Older PyPDF2 releases: copy pages, then metadata, explicitly. Pages are
+    # copied serially on purpose: cloning is pure Python (it holds the GIL),
+    # and every page resolves objects through the reader's single shared
+    # stream, so cloning from several threads corrupts reads. Use
+    # protect_pdfs() to parallelize across files instead.
+    writer = _writer_cls()
+    if hasattr(writer, "append_pages_from_reader"):
+        writer.append_pages_from_reader(reader)
+    else:
+        for page in reader.pages:
+            writer.add_page(page)
+
+    _copy_metadata(reader, writer)
+
+    return writer
+
+
+def _copy_metadata(reader: "PdfReader", writer: "PdfWriter") -> None:
+    """Point the writer's /Info at the reader's dictionary instead of re-adding it."""
+    info = reader.trailer.get("/Info")
+    if info is None:
+        return
+
+    try:
+        writer._info = writer._add_object(info.get_object())
+    except AttributeError:
+        # Private API unavailable: fall back to the public (copying) call
+        if reader.metadata:
+            writer.add_metadata(reader.metadata)
+
+
+class _PipelinedOutput:
+    """
+    Write-only file object that hands chunks to a background writer thread.
+
+    pypdf serializes and encrypts objects in the calling thread while the
+    writer thread performs the blocking writes (which release the GIL). A
+    bounded queue caps the memory held in flight. Only ``write``, ``tell``
+    and ``flush`` are provided; that is all ``PdfWriter.write`` uses.
+    """
+
+    def __init__(self, raw, chunk_size: int = _WRITE_BUFFER_SIZE, depth: int = 8):
+        self._raw = raw
+        self._chunk_size = chunk_size
+        self._buffer = bytearray()
+        self._position = 0
+        self._error = None
+        self._queue = queue.Queue(maxsize=depth)
+        self._thread = threading.Thread(target=self._drain, daemon=True)
+        self._thread.start()
+
+    def _drain(self) -> None:
+        while True:
+            chunk = self._queue.get()
+            if chunk is None:
+                return
+            # After a failure keep consuming so the producer never blocks
+            if self._error is None:
+                try:
+                    self._raw.write(chunk)
+                except BaseException as e:
+                    # Any failure must reach the caller; dying here would
+                    # leave the producer blocked on a full queue
+                    self._error = e
+
+    def write(self, data) -> int:
+        if self._error is not None:
+            raise self._error
+        self._buffer += data
+        self._position += len(data)
+        if len(self._buffer) >= self._chunk_size:
+            self.flush()
+        return len(data)
+
+    def tell(self) -> int:
+        return self._position
+
+    def flush(self) -> None:
+        if self._buffer:
+            chunk, self._buffer = self._buffer, bytearray()
+            self._queue.put(chunk)
+
+    def close(self) -> None:
+        """Hand over remaining data and wait until it has been written."""
+        self.flush()
+        self._queue.put(None)
+        self._thread.join()
+        if self._error is not None:
+            raise self._error
+
+
+def _write_pipelined(writer: "PdfWriter", output_file) -> None:
+    """Serialize writer into output_file, overlapping encryption with disk I/O."""
+    output = _PipelinedOutput(output_file)
+    try:
+        writer.write(output)
+    finally:
+        output.close()
+
+
+# Memoized copies of pypdf's password-only key-derivation steps, created by
+# _key_derivation_cache() on first use.
+_cached_kdf = None
+
+# Serializes every writer.encrypt() call made by protect_pdf. The key cache
+# swaps functions on pypdf's AlgV4 class, so no other thread may encrypt (or
+# save the "originals") while they are installed.
+_KDF_LOCK = threading.Lock()
+
+
+@contextlib.contextmanager
+def _key_derivation_cache(enabled: bool = True):
+    """
+    Hold the encryption lock and, if enabled, memoize the password-dependent
+    part of pypdf's RC4/AES-128 key derivation.
+
+    The /O (owner) value depends only on the passwords, revision and key
+    length, so it is derived once per unique password set. The file key and
+    /U value also depend on each document's /ID and are always recomputed;
+    AES-256 (revision 6) uses random salts and is unaffected.
+    """
+    global _cached_kdf
+    with _KDF_LOCK:
+        if not enabled:
+            yield
+            return
+
+        try:
+            from pypdf._encryption import AlgV4
+        except ImportError:
+            yield
+            return
+
+        if _cached_kdf is None:
+            _cached_kdf = (
+                functools.lru_cache(maxsize=64)(AlgV4.compute_O_value_key),
+                functools.lru_cache(maxsize=64)(AlgV4.compute_O_value),
+            )
+
+        originals = (AlgV4.__dict__["compute_O_value_key"], AlgV4.__dict__["compute_O_value"])
+        AlgV4.compute_O_value_key = staticmethod(_cached_kdf[0])
+        AlgV4.compute_O_value = staticmethod(_cached_kdf[1])
+        try:
+            yield
+        finally:
+            AlgV4.compute_O_value_key, AlgV4.compute_O_value = originals
+
+
+def clear_key_cache() -> None:
+    """Drop every password-derived value cached by ``protect_pdf(key_cache=True)``."""
+    if _cached_kdf is not None:
+        for cached in _cached_kdf:
+            cached.cache_clear()
 
 
 def protect_pdf(
@@ -77,6 +444,7 @@ def protect_pdf(
     output_path: str,
     user_password: str,
     owner_password: str = None,
+    key_cache: bool = False,
 ) -> dict:
     """
     Encrypt a PDF file with a password.
@@ -91,6 +459,10 @@ def protect_pdf(
         Password required to open and view the PDF.
     owner_password : str, optional
         Password for full owner permissions. Defaults to user_password.
+    key_cache : bool, optional
+        Reuse password-derived encryption values across calls with the same
+        passwords. The cache keeps the (padded) passwords in memory until
+        ``clear_key_cache()`` is called.
 
     Returns
     -------
@@ -98,8 +470,13 @@ def protect_pdf(
         A summary of the operation results.
     """
     # Validate inputs
-    in_path = validate_input_file(input_path)
-    out_path = validate_output_path(output_path)
+    # Work with the caller's path strings directly; no Path objects needed
+    input_path = os.fspath(input_path)
+    output_path = os.fspath(output_path)
+    in_stat = _stat_input_file(input_path)
+    error = _output_path_error(output_path)
+    if error:
+        raise error
     validate_password(user_password)
 
     if owner_password:
@@ -107,53 +484,216 @@ def protect_pdf(
     else:
         owner_password = user_password  # Default owner password = user password
 
+    return _protect_validated(
+        input_path, output_path, user_password, owner_password, in_stat, key_cache
+    )
+
+
+def _protect_validated(
+    input_path: str,
+    output_path: str,
+    user_password: str,
+    owner_password: str,
+    in_stat: os.stat_result,
+    key_cache: bool = False,
+) -> dict:
+    """Encrypt a job whose arguments have already been validated.
+
+    ``in_stat`` is the input file's ``os.stat_result`` from validation, so
+    the input is not stat'ed or scanned again.
+    """
+    _load_pdf_lib()
+
     # Read the input PDF
     try:
-        reader = PdfReader(str(in_path))
+        reader, reader_lock = _acquire_reader(input_path, in_stat)
     except Exception as e:
         raise RuntimeError(f"Failed to read PDF file: {e}")
 
-    # Check if already encrypted
-    if reader.is_encrypted:
-        raise ValueError(
-            f"The input PDF is already encrypted: '{input_path}'. "
-            "Please decrypt it first before re-encrypting."
-        )
-
-    total_pages = len(reader.pages)
-    if total_pages == 0:
-        raise ValueError(f"The PDF file has no pages: '{input_path}'")
+    # A cached reader may be shared with other threads; the cloned writer no
+    # longer needs it, so the lock only covers reading and cloning.
+    with reader_lock:
+        # Check if already encrypted
+        if reader.is_encrypted:
+            raise ValueError(
+                f"The input PDF is already encrypted: '{input_path}'. "
+                "Please decrypt it first before re-encrypting."
+            )
 
-    # Build the writer and copy pages
-    writer = PdfWriter()
-    for page in reader.pages:
-        writer.add_page(page)
+        total_pages = len(reader.pages)
+        if total_pages == 0:
+            raise ValueError(f"The PDF file has no pages: '{input_path}'")
 
-    # Copy metadata if available
-    if reader.metadata:
-        writer.add_metadata(reader.metadata)
+        writer = _build_writer(reader)
 
     # Apply encryption
-    writer.encrypt(user_password=user_password, owner_password=owner_password)
+    with _key_derivation_cache(enabled=key_cache):
+        writer.encrypt(user_password=user_password, owner_password=owner_password)
 
     # Save the encrypted PDF
     try:
-        with open(str(out_path), "wb") as output_file:
-            writer.write(output_file)
+        with open(output_path, "wb", buffering=_WRITE_BUFFER_SIZE) as output_file:
+            if in_stat.st_size >= _PIPELINED_WRITE_THRESHOLD:
+                _write_pipelined(writer, output_file)
+            else:
+                writer.write(output_file)
+            output_size = output_file.tell()
     except IOError as e:
         raise IOError(f"Failed to write output file: {e}")
 
     return {
-        "input_file": str(in_path.resolve()),
-        "output_file": str(out_path.resolve()),
+        "input_file": _absolute(input_path),
+        "output_file": _absolute(output_path),
         "pages_protected": total_pages,
-        "input_size_kb": round(in_path.stat().st_size / 1024, 2),
-        "output_size_kb": round(out_path.stat().st_size / 1024, 2),
+        "input_size_kb": round(in_stat.st_size / 1024, 2),
+        "output_size_kb": round(output_size / 1024, 2),
+    }
+
+
+def _absolute(path: str) -> str:
+    """Return path unchanged if already absolute, else made absolute."""
+    return path if os.path.isabs(path) else os.path.abspath(path)
+
+
+def _job_failure(job: tuple, message: str) -> dict:
+    """Build the error entry for a batch job, whatever shape the job has."""
+    return {
+        "input_file": job[0] if len(job) > 0 else None,
+        "output_file": job[1] if len(job) > 1 else None,
+        "error": message,
     }
 
 
-def build_parser() -> argparse.ArgumentParser:
+def _protect_job(job: tuple, key_cache: bool = False) -> dict:
+    """Run one screened batch job, reporting failures in the result instead of raising."""
+    try:
+        return _protect_validated(*job, key_cache=key_cache)
+    except Exception as e:
+        return _job_failure(job, str(e))
+
+
+def _screen_job(job: tuple) -> tuple:
+    """
+    Validate a batch job without raising.
+
+    Returns ``(error_message, None)`` for an invalid job, or ``(None, args)``
+    where ``args`` are the ``_protect_validated`` arguments (including the
+    input's stat result) so the job is not validated a second time.
+    """
+    if len(job) not in (3, 4):
+        return (
+            "Batch job must be (input_path, output_path, user_password"
+            f"[, owner_password]), got {len(job)} fields"
+        ), None
+    try:
+        input_path = os.fspath(job[0])
+        output_path = os.fspath(job[1])
+        user_password = job[2]
+        owner_password = job[3] if len(job) > 3 else None
+
+        error, in_stat = _input_file_error(input_path)
+        if error is None:
+            error = _output_path_error(output_path)
+        if error is None:
+            error = _password_error(user_password)
+        if error is None and owner_password:
+            error = _password_error(owner_password)
+    except Exception as e:
+        # e.g. a path that is None or not a string
+        return f"Invalid batch job: {e}", None
+
+    if error is not None:
+        return str(error), None
+    return None, (input_path, output_path, user_password,
+                  owner_password or user_password, in_stat)
+
+
+def protect_pdfs(jobs: list, workers: int = None, key_cache: bool = False) -> list:
+    """
+    Encrypt many PDF files in a single Python process pool.
+
+    Parameters
+    ----------
+    jobs : list of tuple
+        Each job is ``(input_path, output_path, user_password)`` or
+        ``(input_path, output_path, user_password, owner_password)``, i.e.
+        the positional arguments of ``protect_pdf``.
+    workers : int, optional
+        Number of worker processes. Defaults to ``os.cpu_count()``; with a
+        single worker the jobs run in the calling process.
+    key_cache : bool, optional
+        Passed to ``protect_pdf``; each worker process keeps its own cache.
+
+    Returns
+    -------
+    list of dict
+        One ``protect_pdf`` summary per job, in the same order as ``jobs``.
+        Failed jobs yield ``{"input_file", "output_file", "error"}`` instead.
+    """
+    jobs = [tuple(job) for job in jobs]
+    run_job = functools.partial(_protect_job, key_cache=key_cache)
+
+    # Screen jobs up front so invalid ones are reported without raising or
+    # being shipped to a worker process; valid ones carry their validated
+    # arguments (and input stat) along instead of being checked again
+    results = [None] * len(jobs)
+    pending = []
+    screened = {}
+    for index, job in enumerate(jobs):
+        error, args = _screen_job(job)
+        if error:
+            results[index] = _job_failure(job, error)
+        else:
+            pending.append(index)
+            screened[index] = args
+
+    workers = min(workers or os.cpu_count() or 1, len(pending))
+    if workers <= 1:
+        for index in pending:
+            results[index] = run_job(screened[index])
+        return results
+
+    # Imported here so single-file runs don't pay for the pool machinery
+    import multiprocessing
+    from concurrent.futures import ProcessPoolExecutor
+
+    # "spawn" keeps workers from inheriting the parent's already-imported
+    # pdf library state through fork.
+    context = multiprocessing.get_context("spawn")
+    with ProcessPoolExecutor(max_workers=workers, mp_context=context) as executor:
+        for index, result in zip(pending, executor.map(run_job, [screened[i] for i in pending])):
+            results[index] = result
+    return results
+
+
+def read_batch_file(file_path: str) -> list:
+    """
+    Read batch jobs from a text file with one ``input,output,password`` per line.
+
+    Blank lines and lines starting with ``#`` are ignored. The password is
+    everything after the second comma, so it may itself contain commas.
+    """
+    jobs = []
+    with open(file_path, "r", encoding="utf-8") as batch_file:
+        for line_no, line in enumerate(batch_file, start=1):
+            line = line.strip()
+            if not line or line.startswith("#"):
+                continue
+            fields = [field.strip() for field in line.split(",", 2)]
+            if len(fields) != 3:
+                raise ValueError(
+                    f"Batch file line {line_no} must be 'input,output,password': '{file_path}'"
+                )
+            jobs.append(tuple(fields))
+    return jobs
+
+
+def build_parser() -> "argparse.ArgumentParser":
     """Build and return the argument parser."""
+    # Imported lazily: the common three-positional invocation is handled by
+    # parse_args() without argparse.
+    import argparse
+
     parser = argparse.ArgumentParser(
         prog="pdf_protect",
         description=(
@@ -171,12 +711,15 @@ Examples:
 
   Quiet mode (no output):
       python pdf_protect.py report.pdf secure_report.pdf secret --quiet
+
+  Batch mode (one "input,output,password" per line):
+      python pdf_protect.py --batch jobs.txt --workers 4
         """,
     )
 
-    parser.add_argument("input",  help="Path to the input PDF file.")
-    parser.add_argument("output", help="Path for the output (protected) PDF file.")
-    parser.add_argument("password", help="Password to protect the PDF.")
+    parser.add_argument("input",  nargs="?", help="Path to the input PDF file.")
+    parser.add_argument("output", nargs="?", help="Path for the output (protected) PDF file.")
+    parser.add_argument("password", nargs="?", help="Password to protect the PDF.")
     parser.add_argument(
         "--owner-password",
         metavar="OWNER_PWD",
@@ -191,6 +734,22 @@ Examples:
         action="store_true",
         help="Suppress all output messages.",
     )
+    parser.add_argument(
+        "--batch",
+        metavar="FILE",
+        default=None,
+        help=(
+            "Protect every PDF listed in FILE, one 'input,output,password' per line, "
+            "instead of a single input/output pair."
+        ),
+    )
+    parser.add_argument(
+        "--workers",
+        metavar="N",
+        type=int,
+        default=None,
+        help="Number of worker processes for --batch. Defaults to the CPU count.",
+    )
     parser.add_argument(
         "--version", "-v",
         action="version",
@@ -200,11 +759,70 @@ Examples:
     return parser
 
 
-def main():
+def run_batch(args) -> int:
+    """Protect every job in the batch file; return the number of failures."""
+    jobs = read_batch_file(args.batch)
+    if args.owner_password:
+        jobs = [job + (args.owner_password,) for job in jobs]
+
+    failures = 0
+    # Batch files commonly reuse one password, and the passwords are already
+    # held in memory for the whole run, so always share derived keys.
+    for result in protect_pdfs(jobs, workers=args.workers, key_cache=True):
+        if "error" in result:
+            failures += 1
+            print(f"❌  {result['input_file']}: {result['error']}", file=sys.stderr)
+        elif not args.quiet:
+            print(f"✅  {result['input_file']} -> {result['output_file']}"
+                  f"  ({result['pages_protected']} pages)")
+
+    if not args.quiet:
+        print(f"\n   {len(jobs) - failures} of {len(jobs)} PDFs protected.\n")
+    return failures
+
+
+def parse_args(argv: list = None):
+    """
+    Parse command-line arguments.
+
+    The plain ``input output password`` form is recognised directly; anything
+    with flags (or an unusual argument count) goes through ``build_parser()``.
+    """
+    if argv is None:
+        argv = sys.argv[1:]
+
+    if len(argv) == 3 and not any(arg.startswith("-") for arg in argv):
+        return SimpleNamespace(
+            input=argv[0],
+            output=argv[1],
+            password=argv[2],
+            owner_password=None,
+            quiet=False,
+            batch=None,
+            workers=None,
+        )
+
     parser = build_parser()
-    args = parser.parse_args()
+    args = parser.parse_args(argv)
+
+    if args.batch is None and args.password is None:
+        parser.error("the following arguments are required: input, output, password")
+
+    if args.batch is not None and args.input is not None:
+        parser.error("--batch cannot be combined with input, output or password arguments")
+
+    return args
+
+
+def main():
+    args = parse_args()
 
     try:
+        if args.batch is not None:
+            if run_batch(args):
+                sys.exit(1)
+            return
+
         result = protect_pdf(
             input_path=args.input,
             output_path=args.output,
@@ -225,6 +843,9 @@ def main():
     except PermissionError as e:
         print(f"\n❌  Permission Error: {e}\n", file=sys.stderr)
         sys.exit(1)
+    except ImportError as e:
+        print(f"\n❌  Dependency Error: {e}\n", file=sys.stderr)
+        sys.exit(1)
     except ValueError as e:
         print(f"\n❌  Validation Error: {e}\n", file=sys.stderr)
         sys.exit(1)
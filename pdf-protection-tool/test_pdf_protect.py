@@ -11,7 +11,12 @@ from pathlib import Path
 # Make sure the parent directory is on the path
 sys.path.insert(0, str(Path(__file__).parent.parent))
 
-from pdf_protect import validate_input_file, validate_output_path, validate_password, protect_pdf
+from pdf_protect import (
+    validate_input_file, validate_output_path, validate_password, protect_pdf,
+    protect_pdfs, read_batch_file, clear_reader_cache, _get_reader,
+    build_parser, parse_args, clear_key_cache,
+    check_input_file, check_output_path, check_password,
+)
 
 # ---------------------------------------------------------------------------
 # Fixtures
@@ -43,6 +48,20 @@ def sample_pdf(tmp_path):
         return pdf_path
 
 
+@pytest.fixture
+def multipage_pdf(tmp_path):
+    """Create a three-page PDF with a document title."""
+    from pypdf import PdfWriter
+    pdf_path = tmp_path / "multipage.pdf"
+    writer = PdfWriter()
+    for _ in range(3):
+        writer.add_blank_page(width=612, height=792)
+    writer.add_metadata({"/Title": "Multipage Sample"})
+    with open(pdf_path, "wb") as f:
+        writer.write(f)
+    return pdf_path
+
+
 @pytest.fixture
 def output_pdf(tmp_path):
     return tmp_path / "output.pdf"
@@ -61,18 +80,77 @@ class TestValidateInputFile:
         with pytest.raises(FileNotFoundError, match="not found"):
             validate_input_file(str(tmp_path / "nonexistent.pdf"))
 
+    def test_parent_is_not_a_directory(self, tmp_path):
+        (tmp_path / "notdir.txt").write_text("hello")
+        with pytest.raises(FileNotFoundError, match="not found"):
+            validate_input_file(str(tmp_path / "notdir.txt" / "x.pdf"))
+
     def test_wrong_extension(self, tmp_path):
         txt_file = tmp_path / "document.txt"
         txt_file.write_text("hello")
         with pytest.raises(ValueError, match=".pdf extension"):
             validate_input_file(str(txt_file))
 
+    def test_uppercase_extension(self, tmp_path):
+        upper = tmp_path / "REPORT.Pdf"
+        upper.write_bytes(b"%PDF-1.4\n%%EOF")
+        assert validate_input_file(str(upper)) == upper
+
+    def test_wrong_extension_checked_before_existence(self, tmp_path):
+        with pytest.raises(ValueError, match=".pdf extension"):
+            validate_input_file(str(tmp_path / "missing.txt"))
+
     def test_empty_file(self, tmp_path):
         empty = tmp_path / "empty.pdf"
         empty.write_bytes(b"")
         with pytest.raises(ValueError, match="empty"):
             validate_input_file(str(empty))
 
+    def test_not_a_pdf(self, tmp_path):
+        fake = tmp_path / "fake.pdf"
+        fake.write_bytes(b"PK\x03\x04 zip archive renamed to .pdf")
+        with pytest.raises(ValueError, match="missing %%EOF marker"):
+            validate_input_file(str(fake))
+
+    def test_truncated_pdf(self, sample_pdf):
+        data = sample_pdf.read_bytes()
+        sample_pdf.write_bytes(data[: data.rindex(b"%%EOF")])
+        with pytest.raises(ValueError, match="truncated"):
+            validate_input_file(str(sample_pdf))
+
+    def test_trailing_padding_accepted(self, sample_pdf, output_pdf):
+        # pypdf finds %%EOF anywhere in the file, so the pre-check must too
+        with open(sample_pdf, "ab") as f:
+            f.write(b"\0" * 4096)
+        assert validate_input_file(str(sample_pdf)) == sample_pdf
+        result = protect_pdf(str(sample_pdf), str(output_pdf), "TestPass123")
+        assert result["pages_protected"] >= 1
+
+    @pytest.mark.parametrize("tail", [b"%%EO", b"%%"])
+    def test_truncated_marker_accepted_like_pypdf(self, sample_pdf, output_pdf, tail):
+        from pypdf import PdfReader
+        data = sample_pdf.read_bytes()
+        sample_pdf.write_bytes(data[: data.rindex(b"%%EOF")] + tail + b"\n")
+
+        assert len(PdfReader(str(sample_pdf)).pages) == 1
+        assert check_input_file(str(sample_pdf)) == (True, None)
+        assert protect_pdf(str(sample_pdf), str(output_pdf), "TestPass123")["pages_protected"] == 1
+
+    def test_marker_across_chunk_boundary(self, tmp_path, monkeypatch):
+        import pdf_protect
+        monkeypatch.setattr(pdf_protect, "_MARKER_SCAN_WINDOW", 8)
+        monkeypatch.setattr(pdf_protect, "_EOF_SCAN_CHUNK", 8)
+        padded = tmp_path / "padded.pdf"
+        # 25 bytes: chunks are [17, 25) then [9, 17); %%EOF sits at [14, 19)
+        padded.write_bytes(b"%PDF-1.4\nxxxxx%%EOF" + b"\0" * 6)
+        assert validate_input_file(str(padded)) == padded
+
+    def test_header_not_required(self, tmp_path):
+        # pypdf only warns about leading junk before %PDF-
+        prefixed = tmp_path / "prefixed.pdf"
+        prefixed.write_bytes(b"x" * 2000 + b"%PDF-1.4\n%%EOF")
+        assert validate_input_file(str(prefixed)) == prefixed
+
 
 # ---------------------------------------------------------------------------
 # validate_output_path
@@ -84,6 +162,10 @@ class TestValidateOutputPath:
         result = validate_output_path(str(out))
         assert result == out
 
+    def test_bare_filename_uses_current_directory(self, tmp_path, monkeypatch):
+        monkeypatch.chdir(tmp_path)
+        assert validate_output_path("out.pdf") == Path("out.pdf")
+
     def test_wrong_extension(self, tmp_path):
         with pytest.raises(ValueError, match=".pdf extension"):
             validate_output_path(str(tmp_path / "output.docx"))
@@ -113,6 +195,50 @@ class TestValidatePassword:
         validate_password("abcd")  # exactly 4 chars — should pass
 
 
+# ---------------------------------------------------------------------------
+# check_* (non-raising validation)
+# ---------------------------------------------------------------------------
+
+class TestCheckFunctions:
+    def test_valid_inputs(self, sample_pdf, tmp_path):
+        assert check_input_file(str(sample_pdf)) == (True, None)
+        assert check_output_path(str(tmp_path / "out.pdf")) == (True, None)
+        assert check_password("abcd") == (True, None)
+
+    def test_missing_input(self, tmp_path):
+        ok, message = check_input_file(str(tmp_path / "nonexistent.pdf"))
+        assert not ok
+        assert "not found" in message
+
+    def test_parent_is_not_a_directory(self, tmp_path):
+        (tmp_path / "notdir.txt").write_text("hello")
+        ok, message = check_input_file(str(tmp_path / "notdir.txt" / "x.pdf"))
+        assert not ok
+        assert "not found" in message
+
+    def test_unreadable_input(self, sample_pdf, monkeypatch):
+        import builtins
+        real_open = builtins.open
+
+        def failing_open(file, *args, **kwargs):
+            if str(file) == str(sample_pdf):
+                raise OSError(5, "Input/output error")
+            return real_open(file, *args, **kwargs)
+
+        monkeypatch.setattr(builtins, "open", failing_open)
+        ok, message = check_input_file(str(sample_pdf))
+        assert not ok
+        assert "Input/output error" in message
+
+    def test_bad_output_directory(self):
+        ok, message = check_output_path("/nonexistent_dir/output.pdf")
+        assert not ok
+        assert "directory does not exist" in message
+
+    def test_short_password(self):
+        assert check_password("abc") == (False, "Password must be at least 4 characters long.")
+
+
 # ---------------------------------------------------------------------------
 # protect_pdf (integration)
 # ---------------------------------------------------------------------------
@@ -152,3 +278,300 @@ class TestProtectPdf:
         expected_keys = {"input_file", "output_file", "pages_protected",
                          "input_size_kb", "output_size_kb"}
         assert expected_keys.issubset(result.keys())
+
+    def test_reported_sizes_match_files(self, sample_pdf, output_pdf):
+        result = protect_pdf(str(sample_pdf), str(output_pdf), "TestPass123")
+        assert result["input_size_kb"] == round(sample_pdf.stat().st_size / 1024, 2)
+        assert result["output_size_kb"] == round(output_pdf.stat().st_size / 1024, 2)
+
+    def test_relative_paths_reported_absolute(self, sample_pdf, tmp_path, monkeypatch):
+        monkeypatch.chdir(tmp_path)
+        result = protect_pdf(sample_pdf.name, "relative_out.pdf", "TestPass123")
+        assert result["input_file"] == os.path.join(os.getcwd(), sample_pdf.name)
+        assert result["output_file"] == os.path.join(os.getcwd(), "relative_out.pdf")
+
+    def test_page_count_preserved(self, multipage_pdf, output_pdf):
+        result = protect_pdf(str(multipage_pdf), str(output_pdf), "TestPass123")
+        from pypdf import PdfReader
+        reader = PdfReader(str(output_pdf))
+        reader.decrypt("TestPass123")
+        assert result["pages_protected"] == 3
+        assert len(reader.pages) == 3
+
+    def test_metadata_preserved(self, multipage_pdf, output_pdf):
+        protect_pdf(str(multipage_pdf), str(output_pdf), "TestPass123")
+        from pypdf import PdfReader
+        reader = PdfReader(str(output_pdf))
+        reader.decrypt("TestPass123")
+        assert reader.metadata.title == "Multipage Sample"
+
+    def test_fallback_copy_preserves_metadata(self, multipage_pdf, output_pdf, monkeypatch):
+        import pdf_protect
+        from pypdf import PdfReader, PdfWriter
+
+        class LegacyWriter(PdfWriter):
+            """Mimic PyPDF2 releases whose writer has no clone_from."""
+            def __init__(self):
+                super().__init__()
+
+        pdf_protect._load_pdf_lib()
+        monkeypatch.setattr(pdf_protect, "_writer_cls", LegacyWriter)
+        protect_pdf(str(multipage_pdf), str(output_pdf), "TestPass123")
+
+        reader = PdfReader(str(output_pdf))
+        reader.decrypt("TestPass123")
+        assert len(reader.pages) == 3
+        assert reader.metadata.title == "Multipage Sample"
+
+    def test_key_cache_reuses_owner_value(self, sample_pdf, tmp_path):
+        import pdf_protect
+        from pypdf import PdfReader
+        from pypdf._encryption import AlgV4
+
+        original = AlgV4.__dict__["compute_O_value"]
+        clear_key_cache()
+        for name in ("a.pdf", "b.pdf"):
+            protect_pdf(str(sample_pdf), str(tmp_path / name), "TestPass123",
+                        key_cache=True)
+
+        assert pdf_protect._cached_kdf[1].cache_info().hits == 1
+        assert AlgV4.__dict__["compute_O_value"] is original
+        for name in ("a.pdf", "b.pdf"):
+            reader = PdfReader(str(tmp_path / name))
+            assert reader.decrypt("TestPass123")
+
+    def test_pipelined_write(self, multipage_pdf, output_pdf, monkeypatch):
+        import pdf_protect
+        from pypdf import PdfReader
+
+        monkeypatch.setattr(pdf_protect, "_PIPELINED_WRITE_THRESHOLD", 0)
+        result = protect_pdf(str(multipage_pdf), str(output_pdf), "TestPass123")
+
+        assert result["output_size_kb"] == round(output_pdf.stat().st_size / 1024, 2)
+        reader = PdfReader(str(output_pdf))
+        assert reader.decrypt("TestPass123")
+        assert len(reader.pages) == 3
+
+    def test_pipelined_output_preserves_bytes(self):
+        import io
+        from pdf_protect import _PipelinedOutput
+
+        raw = io.BytesIO()
+        output = _PipelinedOutput(raw, chunk_size=3, depth=1)
+        for piece in (b"%PDF", b"-1.", b"7\n", b"body"):
+            output.write(piece)
+        assert output.tell() == 13
+        output.close()
+        assert raw.getvalue() == b"%PDF-1.7\nbody"
+
+    def test_uncached_caller_waits_for_patched_kdf(self, sample_pdf, output_pdf):
+        import threading
+        import pdf_protect
+        from pypdf._encryption import AlgV4
+
+        originals = (AlgV4.__dict__["compute_O_value_key"], AlgV4.__dict__["compute_O_value"])
+        clear_key_cache()
+        plain = threading.Thread(
+            target=protect_pdf, args=(str(sample_pdf), str(output_pdf), "PlainPass1")
+        )
+
+        # While one caller has the cached functions installed, a caller that
+        # did not opt in must not encrypt (and so never feeds the cache)
+        with pdf_protect._key_derivation_cache():
+            plain.start()
+            plain.join(timeout=0.5)
+            assert plain.is_alive()
+        plain.join()
+
+        assert output_pdf.exists()
+        assert pdf_protect._cached_kdf[1].cache_info().currsize == 0
+        assert AlgV4.__dict__["compute_O_value_key"] is originals[0]
+        assert AlgV4.__dict__["compute_O_value"] is originals[1]
+
+    def test_pipelined_output_surfaces_non_os_errors(self):
+        import threading
+        from pdf_protect import _PipelinedOutput
+
+        class BrokenRaw:
+            def write(self, data):
+                raise ValueError("write to closed file")
+
+        outcome = []
+
+        def produce():
+            output = _PipelinedOutput(BrokenRaw(), chunk_size=1, depth=1)
+            try:
+                for _ in range(20):
+                    output.write(b"x")
+                output.close()
+            except ValueError as e:
+                outcome.append(e)
+
+        producer = threading.Thread(target=produce, daemon=True)
+        producer.start()
+        producer.join(timeout=5)
+        assert not producer.is_alive(), "producer hung after writer thread failed"
+        assert outcome and "closed file" in str(outcome[0])
+
+    def test_reader_reused_for_same_input(self, sample_pdf, tmp_path):
+        clear_reader_cache()
+        protect_pdf(str(sample_pdf), str(tmp_path / "a.pdf"), "FirstPass1")
+        protect_pdf(str(sample_pdf), str(tmp_path / "b.pdf"), "SecondPass2")
+        assert _get_reader.cache_info().hits == 1
+
+        from pypdf import PdfReader
+        reader = PdfReader(str(tmp_path / "b.pdf"))
+        assert reader.decrypt("SecondPass2")
+
+    def test_concurrent_calls_share_cached_reader(self, tmp_path):
+        import threading
+        from concurrent.futures import ThreadPoolExecutor
+
+        # report.pdf has fonts and images shared between pages, whose lazy
+        # resolution through one stream breaks if threads interleave
+        source = str(Path(__file__).parent / "report.pdf")
+        for round_no in range(3):
+            clear_reader_cache()
+            barrier = threading.Barrier(8)
+
+            def job(i):
+                barrier.wait()
+                out = str(tmp_path / f"out{round_no}_{i}.pdf")
+                return protect_pdf(source, out, "TestPass123")
+
+            with ThreadPoolExecutor(max_workers=8) as executor:
+                results = list(executor.map(job, range(8)))
+            assert all(r["pages_protected"] == 2 for r in results)
+
+    def test_large_files_not_cached(self, sample_pdf, output_pdf, monkeypatch):
+        import pdf_protect
+
+        clear_reader_cache()
+        monkeypatch.setattr(pdf_protect, "_READER_CACHE_MAX_FILE_SIZE", 0)
+        protect_pdf(str(sample_pdf), str(output_pdf), "TestPass123")
+        assert _get_reader.cache_info().currsize == 0
+
+    def test_clear_reader_cache(self, sample_pdf, output_pdf):
+        protect_pdf(str(sample_pdf), str(output_pdf), "TestPass123")
+        clear_reader_cache()
+        assert _get_reader.cache_info().currsize == 0
+
+
+# ---------------------------------------------------------------------------
+# protect_pdfs / read_batch_file (batch mode)
+# ---------------------------------------------------------------------------
+
+class TestProtectPdfs:
+    def test_serial_batch(self, sample_pdf, tmp_path):
+        jobs = [(str(sample_pdf), str(tmp_path / f"out{i}.pdf"), "TestPass123")
+                for i in range(3)]
+        results = protect_pdfs(jobs, workers=1)
+        assert [r["output_file"] for r in results] == [
+            str((tmp_path / f"out{i}.pdf").resolve()) for i in range(3)
+        ]
+        assert all(r["pages_protected"] >= 1 for r in results)
+
+    def test_parallel_batch(self, sample_pdf, tmp_path):
+        jobs = [(str(sample_pdf), str(tmp_path / f"out{i}.pdf"), "TestPass123")
+                for i in range(2)]
+        results = protect_pdfs(jobs, workers=2)
+        assert len(results) == 2
+        assert all((tmp_path / f"out{i}.pdf").exists() for i in range(2))
+
+    def test_failures_are_collected(self, sample_pdf, tmp_path):
+        jobs = [
+            (str(tmp_path / "missing.pdf"), str(tmp_path / "a.pdf"), "TestPass123"),
+            (str(sample_pdf), str(tmp_path / "b.pdf"), "TestPass123"),
+        ]
+        results = protect_pdfs(jobs, workers=1)
+        assert "not found" in results[0]["error"]
+        assert "error" not in results[1]
+
+    def test_unusual_bad_path_does_not_abort_batch(self, sample_pdf, tmp_path):
+        (tmp_path / "notdir.txt").write_text("hello")
+        jobs = [
+            (str(tmp_path / "notdir.txt" / "x.pdf"), str(tmp_path / "a.pdf"), "TestPass123"),
+            (str(sample_pdf), str(tmp_path / "b.pdf"), "TestPass123"),
+        ]
+        results = protect_pdfs(jobs, workers=1)
+        assert "not found" in results[0]["error"]
+        assert results[1]["pages_protected"] >= 1
+
+    def test_malformed_jobs_do_not_abort_batch(self, sample_pdf, tmp_path):
+        good = (str(sample_pdf), str(tmp_path / "good.pdf"), "TestPass123")
+        jobs = [
+            (str(sample_pdf), str(tmp_path / "a.pdf")),
+            (None, str(tmp_path / "b.pdf"), "TestPass123"),
+            (str(sample_pdf), str(tmp_path / "c.pdf"), 1234),
+            good,
+        ]
+        results = protect_pdfs(jobs, workers=1)
+        assert "got 2 fields" in results[0]["error"]
+        assert results[0]["input_file"] == str(sample_pdf)
+        assert "Invalid batch job" in results[1]["error"]
+        assert "must be a string" in results[2]["error"]
+        assert results[3]["pages_protected"] >= 1
+
+    def test_screened_jobs_not_validated_twice(self, sample_pdf, tmp_path, monkeypatch):
+        import pdf_protect
+
+        calls = []
+        real = pdf_protect._input_file_error
+
+        def counting(file_path):
+            calls.append(file_path)
+            return real(file_path)
+
+        monkeypatch.setattr(pdf_protect, "_input_file_error", counting)
+        jobs = [(str(sample_pdf), str(tmp_path / f"out{i}.pdf"), "TestPass123")
+                for i in range(2)]
+        results = protect_pdfs(jobs, workers=1)
+        assert all(r["pages_protected"] >= 1 for r in results)
+        assert len(calls) == 2
+
+    def test_read_batch_file(self, tmp_path):
+        batch = tmp_path / "jobs.txt"
+        batch.write_text("# comment\n\na.pdf, b.pdf, pa,ss\n")
+        assert read_batch_file(str(batch)) == [("a.pdf", "b.pdf", "pa,ss")]
+
+    def test_read_batch_file_bad_line(self, tmp_path):
+        batch = tmp_path / "jobs.txt"
+        batch.write_text("a.pdf,b.pdf\n")
+        with pytest.raises(ValueError, match="line 1"):
+            read_batch_file(str(batch))
+
+
+# ---------------------------------------------------------------------------
+# parse_args
+# ---------------------------------------------------------------------------
+
+class TestParseArgs:
+    def test_positional_fast_path_matches_argparse(self):
+        argv = ["in.pdf", "out.pdf", "secret"]
+        assert vars(parse_args(argv)) == vars(build_parser().parse_args(argv))
+
+    def test_flags_use_argparse(self):
+        args = parse_args(["in.pdf", "out.pdf", "secret", "--owner-password", "admin", "-q"])
+        assert args.owner_password == "admin"
+        assert args.quiet
+
+    def test_import_does_not_load_pypdf(self):
+        import subprocess
+        code = "import sys, pdf_protect; sys.exit('pypdf' in sys.modules)"
+        completed = subprocess.run(
+            [sys.executable, "-c", code], cwd=str(Path(__file__).parent)
+        )
+        assert completed.returncode == 0
+
+    def test_batch_rejects_positionals(self):
+        with pytest.raises(SystemExit):
+            parse_args(["--batch", "jobs.txt", "extra"])
+
+    def test_batch_alone(self):
+        args = parse_args(["--batch", "jobs.txt"])
+        assert args.batch == "jobs.txt"
+        assert args.input is None
+
+    def test_missing_positionals_without_batch(self):
+        with pytest.raises(SystemExit):
+            parse_args(["in.pdf"])